@@ -2,22 +2,20 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 ##
-from typing import TYPE_CHECKING, Dict
+import copy
+import functools
+import weakref
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple
 from azure.quantum import __version__
 from azure.quantum.target.ionq import IonQ
 from abc import abstractmethod
 
 from .backend import AzureBackend, AzureQirBackend
 
-from qiskit.providers.models import BackendConfiguration
+from qiskit.providers.models import BackendConfiguration, GateConfig
 from qiskit.providers import Options, Provider
 
-from qiskit_ionq.helpers import (
-    ionq_basis_gates,
-    GATESET_MAP,
-    qiskit_circ_to_ionq_circ,
-)
-
 if TYPE_CHECKING:
     from azure.quantum.qiskit import AzureQuantumProvider
 
@@ -39,6 +37,139 @@ __all__ = [
     "IonQAriaNativeBackend",
 ]
 
+# Names this module used to import eagerly from qiskit_ionq.helpers.
+_HELPER_NAMES = ("ionq_basis_gates", "GATESET_MAP", "qiskit_circ_to_ionq_circ")
+
+# Maximum number of translated circuits kept per IonQBackend instance.
+_TRANSLATION_CACHE_SIZE = 16
+
+_IONQ_AZURE_CONFIG = MappingProxyType(
+    {
+        "blob_name": "inputData",
+        "content_type": "application/json",
+        "provider_id": "ionq",
+        "input_data_format": "ionq.circuit.v1",
+        "output_data_format": "ionq.quantum-results.v1",
+        "is_default": True,
+    }
+)
+_IONQ_NATIVE_AZURE_CONFIG = MappingProxyType(
+    {**_IONQ_AZURE_CONFIG, "is_default": False}
+)
+_IONQ_QIR_AZURE_CONFIG = MappingProxyType({"provider_id": "ionq"})
+
+# Default configurations, keyed on (backend class, backend name, gateset).
+# Backends with the same key share the configuration, so treat it as read-only.
+_ConfigurationKey = Tuple[type, str, Optional[str]]
+_DEFAULT_CONFIGURATIONS: Dict[_ConfigurationKey, BackendConfiguration] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _helpers() -> ModuleType:
+    """Imports qiskit_ionq.helpers on first use, keeping it off the import path."""
+    import qiskit_ionq.helpers
+
+    return qiskit_ionq.helpers
+
+
+def __getattr__(name: str):
+    if name in _HELPER_NAMES:
+        return getattr(_helpers(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _translation_fingerprint(circuit) -> Tuple:
+    """Returns the parts of the circuit that qiskit_circ_to_ionq_circ depends on."""
+    return (
+        tuple(circuit.qubits),
+        tuple(circuit.clbits),
+        tuple(
+            (
+                operation,
+                operation.name,
+                tuple(operation.params),
+                getattr(operation, "num_ctrl_qubits", 0),
+                tuple(qargs),
+                tuple(cargs),
+            )
+            # Unpacked like qiskit_ionq does, which also works before
+            # qiskit-terra 0.21 introduced CircuitInstruction.
+            for operation, qargs, cargs in circuit.data
+        ),
+    )
+
+
+def _config_template(
+    description: str, n_qubits: int, simulator: bool, max_shots: Optional[int]
+) -> Dict[str, Any]:
+    """Returns the static configuration fields of an IonQ backend."""
+    return {
+        "backend_version": __version__,
+        "simulator": simulator,
+        "local": False,
+        "coupling_map": None,
+        "description": description,
+        "memory": False,
+        "n_qubits": n_qubits,
+        "conditional": False,
+        "max_shots": max_shots,
+        "max_experiments": 1,
+        "open_pulse": False,
+        "gates": [GateConfig(name="TODO", parameters=[], qasm_def="TODO")],
+    }
+
+
+# The QIR and non-QIR backends of the same target share their static fields.
+_SIMULATOR_CONFIG_TEMPLATE = _config_template(
+    "IonQ simulator on Azure Quantum", n_qubits=29, simulator=True, max_shots=None
+)
+_QPU_CONFIG_TEMPLATE = _config_template(
+    "IonQ QPU on Azure Quantum", n_qubits=11, simulator=False, max_shots=10000
+)
+_ARIA_CONFIG_TEMPLATE = _config_template(
+    "IonQ Aria QPU on Azure Quantum", n_qubits=23, simulator=False, max_shots=10000
+)
+
+
+def _get_default_configuration(
+    backend, name: str, gateset: Optional[str] = None
+) -> BackendConfiguration:
+    """Returns the default configuration of the given backend, building it from
+    the backend's _CONFIG_TEMPLATE on first use."""
+    key = (type(backend), name, gateset)
+    configuration = _DEFAULT_CONFIGURATIONS.get(key)
+    if configuration is None:
+        config = backend._CONFIG_TEMPLATE.copy()
+        config["gates"] = copy.deepcopy(config["gates"])
+        config["backend_name"] = name
+        config["azure"] = backend._azure_config()
+        if gateset is None:
+            config["basis_gates"] = _helpers().ionq_basis_gates
+        else:
+            config["basis_gates"] = _helpers().GATESET_MAP[gateset]
+            config["gateset"] = gateset
+        # The template already holds GateConfig objects, so construct directly
+        # instead of going through from_dict.
+        configuration = BackendConfiguration(**config)
+        _DEFAULT_CONFIGURATIONS[key] = configuration
+    return configuration
+
+
+def _pop_configuration(
+    backend,
+    name: str,
+    kwargs: Dict[str, Any],
+    message: str,
+    gateset: Optional[str] = None,
+) -> BackendConfiguration:
+    """Logs the initialization and pops the given or default configuration."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message)
+    configuration: BackendConfiguration = kwargs.pop("configuration", None)
+    if configuration is None:
+        configuration = _get_default_configuration(backend, name, gateset)
+    return configuration
+
 
 class IonQQirBackendBase(AzureQirBackend):
     """Base class for interfacing with an IonQ QIR backend"""
@@ -49,48 +180,30 @@ class IonQQirBackendBase(AzureQirBackend):
     ):
         super().__init__(configuration, provider, **fields)
 
+    _DEFAULT_OPTIONS: ClassVar[Options] = Options(
+        shots=500, targetCapability="BasicExecution"
+    )
+
     @classmethod
     def _default_options(cls) -> Options:
-        return Options(shots=500, targetCapability="BasicExecution")
+        # Backends update their options in place, so hand out a copy of the template.
+        return copy.copy(cls._DEFAULT_OPTIONS)
 
     def _azure_config(self) -> Dict[str, str]:
         config = super()._azure_config()
-        config.update(
-            {
-                "provider_id": "ionq",
-            }
-        )
+        config.update(_IONQ_QIR_AZURE_CONFIG)
         return config
 
 
 class IonQSimulatorQirBackend(IonQQirBackendBase):
     backend_names = ("ionq.simulator",)
 
+    _CONFIG_TEMPLATE: ClassVar[Dict[str, Any]] = _SIMULATOR_CONFIG_TEMPLATE
+
     def __init__(self, name: str, provider: "AzureQuantumProvider", **kwargs):
         """Base class for interfacing with an IonQ QIR Simulator backend"""
-
-        default_config = BackendConfiguration.from_dict(
-            {
-                "backend_name": name,
-                "backend_version": __version__,
-                "simulator": True,
-                "local": False,
-                "coupling_map": None,
-                "description": "IonQ simulator on Azure Quantum",
-                "basis_gates": ionq_basis_gates,
-                "memory": False,
-                "n_qubits": 29,
-                "conditional": False,
-                "max_shots": None,
-                "max_experiments": 1,
-                "open_pulse": False,
-                "gates": [{"name": "TODO", "parameters": [], "qasm_def": "TODO"}],
-                "azure": self._azure_config(),
-            }
-        )
-        logger.info("Initializing IonQSimulatorQirBackend")
-        configuration: BackendConfiguration = kwargs.pop(
-            "configuration", default_config
+        configuration = _pop_configuration(
+            self, name, kwargs, "Initializing IonQSimulatorQirBackend"
         )
         super().__init__(configuration=configuration, provider=provider, **kwargs)
 
@@ -98,31 +211,12 @@ class IonQSimulatorQirBackend(IonQQirBackendBase):
 class IonQQPUQirBackend(IonQQirBackendBase):
     backend_names = ("ionq.qpu",)
 
+    _CONFIG_TEMPLATE: ClassVar[Dict[str, Any]] = _QPU_CONFIG_TEMPLATE
+
     def __init__(self, name: str, provider: "AzureQuantumProvider", **kwargs):
         """Base class for interfacing with an IonQ QPU backend"""
-
-        default_config = BackendConfiguration.from_dict(
-            {
-                "backend_name": name,
-                "backend_version": __version__,
-                "simulator": False,
-                "local": False,
-                "coupling_map": None,
-                "description": "IonQ QPU on Azure Quantum",
-                "basis_gates": ionq_basis_gates,
-                "memory": False,
-                "n_qubits": 11,
-                "conditional": False,
-                "max_shots": 10000,
-                "max_experiments": 1,
-                "open_pulse": False,
-                "gates": [{"name": "TODO", "parameters": [], "qasm_def": "TODO"}],
-                "azure": self._azure_config(),
-            }
-        )
-        logger.info("Initializing IonQQPUQirBackend")
-        configuration: BackendConfiguration = kwargs.pop(
-            "configuration", default_config
+        configuration = _pop_configuration(
+            self, name, kwargs, "Initializing IonQQPUQirBackend"
         )
         super().__init__(configuration=configuration, provider=provider, **kwargs)
 
@@ -130,31 +224,12 @@ class IonQQPUQirBackend(IonQQirBackendBase):
 class IonQAriaQirBackend(IonQQirBackendBase):
     backend_names = ("ionq.qpu.aria-1", "ionq.qpu.aria-2")
 
+    _CONFIG_TEMPLATE: ClassVar[Dict[str, Any]] = _ARIA_CONFIG_TEMPLATE
+
     def __init__(self, name: str, provider: "AzureQuantumProvider", **kwargs):
         """Base class for interfacing with an IonQ Aria QPU backend"""
-
-        default_config = BackendConfiguration.from_dict(
-            {
-                "backend_name": name,
-                "backend_version": __version__,
-                "simulator": False,
-                "local": False,
-                "coupling_map": None,
-                "description": "IonQ Aria QPU on Azure Quantum",
-                "basis_gates": ionq_basis_gates,
-                "memory": False,
-                "n_qubits": 23,
-                "conditional": False,
-                "max_shots": 10000,
-                "max_experiments": 1,
-                "open_pulse": False,
-                "gates": [{"name": "TODO", "parameters": [], "qasm_def": "TODO"}],
-                "azure": self._azure_config(),
-            }
-        )
-        logger.info("Initializing IonQAriaQirBackend")
-        configuration: BackendConfiguration = kwargs.pop(
-            "configuration", default_config
+        configuration = _pop_configuration(
+            self, name, kwargs, "Initializing IonQAriaQirBackend"
         )
         super().__init__(configuration=configuration, provider=provider, **kwargs)
 
@@ -169,23 +244,56 @@ class IonQBackend(AzureBackend):
         self, configuration: BackendConfiguration, provider: Provider = None, **fields
     ):
         super().__init__(configuration, provider, **fields)
+        # The gateset is fixed at construction, so look it up only once.
+        self._gateset = getattr(self.configuration(), "gateset", None)
+        self._translation_cache = {}
+
+    _DEFAULT_OPTIONS: ClassVar[Options] = Options(shots=500)
 
     @classmethod
     def _default_options(cls):
-        return Options(shots=500)
+        # Backends update their options in place, so hand out a copy of the template.
+        return copy.copy(cls._DEFAULT_OPTIONS)
 
     def _azure_config(self) -> Dict[str, str]:
-        return {
-            "blob_name": "inputData",
-            "content_type": "application/json",
-            "provider_id": "ionq",
-            "input_data_format": "ionq.circuit.v1",
-            "output_data_format": "ionq.quantum-results.v1",
-            "is_default": True,
-        }
+        return dict(_IONQ_AZURE_CONFIG)
+
+    def _translate_cached(self, circuit, release: bool = False):
+        """Translates the circuit, reusing a translation while it is unchanged."""
+        gateset = self._gateset
+        key = (id(circuit), gateset)
+        fingerprint = _translation_fingerprint(circuit)
+        cached = self._translation_cache.get(key)
+        # Entries only hold a weak reference to the circuit, which also guards
+        # against a recycled id() matching a different circuit.
+        if cached is not None and cached[0]() is circuit and cached[1] == fingerprint:
+            if release:
+                self._translation_cache.pop(key, None)
+            _, _, ionq_circ, num_meas, meas_map = cached
+            return ionq_circ, num_meas, meas_map.copy()
+
+        ionq_circ, num_meas, meas_map = _helpers().qiskit_circ_to_ionq_circ(
+            circuit, gateset=gateset
+        )
+        if release:
+            return ionq_circ, num_meas, meas_map
+
+        self._translation_cache.pop(key, None)
+        if len(self._translation_cache) >= _TRANSLATION_CACHE_SIZE:
+            self._translation_cache.pop(next(iter(self._translation_cache)))
+        cache = self._translation_cache
+        circuit_ref = weakref.ref(circuit, lambda _: cache.pop(key, None))
+        self._translation_cache[key] = (
+            circuit_ref,
+            fingerprint,
+            ionq_circ,
+            num_meas,
+            meas_map,
+        )
+        return ionq_circ, num_meas, meas_map.copy()
 
     def _prepare_job_metadata(self, circuit, **kwargs):
-        _, _, meas_map = qiskit_circ_to_ionq_circ(circuit, gateset=self.gateset())
+        _, _, meas_map = self._translate_cached(circuit)
 
         metadata = super()._prepare_job_metadata(circuit, **kwargs)
         metadata["meas_map"] = meas_map
@@ -194,58 +302,48 @@ class IonQBackend(AzureBackend):
 
     def _translate_input(self, circuit):
         """Translates the input values to the format expected by the AzureBackend."""
-        ionq_circ, _, _ = qiskit_circ_to_ionq_circ(circuit, gateset=self.gateset())
+        # This is the last step of a submission, so reuse the translation done by
+        # _prepare_job_metadata and don't keep the circuit around afterwards.
+        ionq_circ, _, _ = self._translate_cached(circuit, release=True)
         input_data = {
-            "gateset": self.gateset(),
+            "gateset": self._gateset,
             "qubits": circuit.num_qubits,
             "circuit": ionq_circ,
         }
         return IonQ._encode_input_data(input_data)
 
     def gateset(self):
-        return self.configuration().gateset
+        return self._gateset
 
     def estimate_cost(self, circuit, shots):
         """Estimate the cost for the given circuit."""
-        ionq_circ, _, _ = qiskit_circ_to_ionq_circ(circuit, gateset=self.gateset())
+        ionq_circ, _, _ = self._translate_cached(circuit)
         input_data = {
             "qubits": circuit.num_qubits,
             "circuit": ionq_circ,
         }
+        return self._cost_target.estimate_cost(input_data, num_shots=shots)
+
+    @functools.cached_property
+    def _cost_target(self):
+        """The workspace target used by estimate_cost, looked up on first use."""
         workspace = self.provider().get_workspace()
         target = workspace.get_targets(self.name())
-        return target.estimate_cost(input_data, num_shots=shots)
+        if isinstance(target, list):
+            target = target[0]
+        return target
 
 
 class IonQSimulatorBackend(IonQBackend):
     backend_names = ("ionq.simulator",)
 
+    _CONFIG_TEMPLATE: ClassVar[Dict[str, Any]] = _SIMULATOR_CONFIG_TEMPLATE
+
     def __init__(self, name: str, provider: "AzureQuantumProvider", **kwargs):
         """Base class for interfacing with an IonQ Simulator backend"""
         gateset = kwargs.pop("gateset", "qis")
-        default_config = BackendConfiguration.from_dict(
-            {
-                "backend_name": name,
-                "backend_version": __version__,
-                "simulator": True,
-                "local": False,
-                "coupling_map": None,
-                "description": "IonQ simulator on Azure Quantum",
-                "basis_gates": GATESET_MAP[gateset],
-                "memory": False,
-                "n_qubits": 29,
-                "conditional": False,
-                "max_shots": None,
-                "max_experiments": 1,
-                "open_pulse": False,
-                "gates": [{"name": "TODO", "parameters": [], "qasm_def": "TODO"}],
-                "azure": self._azure_config(),
-                "gateset": gateset,
-            }
-        )
-        logger.info("Initializing IonQSimulatorBackend")
-        configuration: BackendConfiguration = kwargs.pop(
-            "configuration", default_config
+        configuration = _pop_configuration(
+            self, name, kwargs, "Initializing IonQSimulatorBackend", gateset=gateset
         )
         super().__init__(configuration=configuration, provider=provider, **kwargs)
 
@@ -257,44 +355,19 @@ class IonQSimulatorNativeBackend(IonQSimulatorBackend):
         super().__init__(name, provider, **kwargs)
 
     def _azure_config(self) -> Dict[str, str]:
-        config = super()._azure_config()
-        config.update(
-            {
-                "is_default": False,
-            }
-        )
-        return config
+        return dict(_IONQ_NATIVE_AZURE_CONFIG)
 
 
 class IonQQPUBackend(IonQBackend):
     backend_names = ("ionq.qpu",)
 
+    _CONFIG_TEMPLATE: ClassVar[Dict[str, Any]] = _QPU_CONFIG_TEMPLATE
+
     def __init__(self, name: str, provider: "AzureQuantumProvider", **kwargs):
         """Base class for interfacing with an IonQ QPU backend"""
         gateset = kwargs.pop("gateset", "qis")
-        default_config = BackendConfiguration.from_dict(
-            {
-                "backend_name": name,
-                "backend_version": __version__,
-                "simulator": False,
-                "local": False,
-                "coupling_map": None,
-                "description": "IonQ QPU on Azure Quantum",
-                "basis_gates": GATESET_MAP[gateset],
-                "memory": False,
-                "n_qubits": 11,
-                "conditional": False,
-                "max_shots": 10000,
-                "max_experiments": 1,
-                "open_pulse": False,
-                "gates": [{"name": "TODO", "parameters": [], "qasm_def": "TODO"}],
-                "azure": self._azure_config(),
-                "gateset": gateset,
-            }
-        )
-        logger.info("Initializing IonQQPUBackend")
-        configuration: BackendConfiguration = kwargs.pop(
-            "configuration", default_config
+        configuration = _pop_configuration(
+            self, name, kwargs, "Initializing IonQQPUBackend", gateset=gateset
         )
         super().__init__(configuration=configuration, provider=provider, **kwargs)
 
@@ -306,44 +379,19 @@ class IonQQPUNativeBackend(IonQQPUBackend):
         super().__init__(name, provider, **kwargs)
 
     def _azure_config(self) -> Dict[str, str]:
-        config = super()._azure_config()
-        config.update(
-            {
-                "is_default": False,
-            }
-        )
-        return config
+        return dict(_IONQ_NATIVE_AZURE_CONFIG)
 
 
 class IonQAriaBackend(IonQBackend):
     backend_names = ("ionq.qpu.aria-1", "ionq.qpu.aria-2")
 
+    _CONFIG_TEMPLATE: ClassVar[Dict[str, Any]] = _ARIA_CONFIG_TEMPLATE
+
     def __init__(self, name: str, provider: "AzureQuantumProvider", **kwargs):
         """Base class for interfacing with an IonQ Aria QPU backend"""
         gateset = kwargs.pop("gateset", "qis")
-        default_config = BackendConfiguration.from_dict(
-            {
-                "backend_name": name,
-                "backend_version": __version__,
-                "simulator": False,
-                "local": False,
-                "coupling_map": None,
-                "description": "IonQ Aria QPU on Azure Quantum",
-                "basis_gates": GATESET_MAP[gateset],
-                "memory": False,
-                "n_qubits": 23,
-                "conditional": False,
-                "max_shots": 10000,
-                "max_experiments": 1,
-                "open_pulse": False,
-                "gates": [{"name": "TODO", "parameters": [], "qasm_def": "TODO"}],
-                "azure": self._azure_config(),
-                "gateset": gateset,
-            }
-        )
-        logger.info("Initializing IonQAriaQPUBackend")
-        configuration: BackendConfiguration = kwargs.pop(
-            "configuration", default_config
+        configuration = _pop_configuration(
+            self, name, kwargs, "Initializing IonQAriaQPUBackend", gateset=gateset
         )
         super().__init__(configuration=configuration, provider=provider, **kwargs)
 
@@ -355,10 +403,4 @@ class IonQAriaNativeBackend(IonQAriaBackend):
         super().__init__(name, provider, **kwargs)
 
     def _azure_config(self) -> Dict[str, str]:
-        config = super()._azure_config()
-        config.update(
-            {
-                "is_default": False,
-            }
-        )
-        return config
+        return dict(_IONQ_NATIVE_AZURE_CONFIG)
@@ -510,6 +510,225 @@ class TestQiskit(QuantumTestBase):
         config = backend.configuration()
         self.assertEqual(config.gateset, "qis")
 
+    @pytest.mark.ionq
+    def test_ionq_default_configuration_is_reused(self):
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.qpu")
+        other = DummyProvider().get_backend("ionq.qpu")
+        self.assertIsNot(backend, other)
+        self.assertIs(backend.configuration(), other.configuration())
+
+        native = provider.get_backend("ionq.qpu", gateset="native")
+        self.assertIsNot(backend.configuration(), native.configuration())
+        self.assertEqual("native", native.configuration().gateset)
+        self.assertFalse(native.configuration().azure["is_default"])
+        self.assertTrue(backend.configuration().azure["is_default"])
+        # Configurations with different keys don't share their gate definitions.
+        self.assertIsNot(backend.configuration().gates, native.configuration().gates)
+        self.assertIsNot(
+            backend.configuration().gates[0], native.configuration().gates[0]
+        )
+
+        aria_1 = provider.get_backend("ionq.qpu.aria-1", input_data_format="qir.v1")
+        aria_2 = provider.get_backend("ionq.qpu.aria-2", input_data_format="qir.v1")
+        self.assertEqual("ionq.qpu.aria-1", aria_1.name())
+        self.assertEqual("ionq.qpu.aria-2", aria_2.name())
+
+    @pytest.mark.ionq
+    def test_ionq_estimate_cost_reuses_target(self):
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.simulator")
+        circuit = self._3_qubit_ghz()
+
+        with unittest.mock.patch.object(provider, "get_workspace") as get_workspace:
+            get_targets = get_workspace.return_value.get_targets
+            for shots in (100, 200, 300):
+                backend.estimate_cost(circuit, shots=shots)
+
+        get_workspace.assert_called_once()
+        get_targets.assert_called_once_with("ionq.simulator")
+        self.assertEqual(3, get_targets.return_value.estimate_cost.call_count)
+
+    @pytest.mark.ionq
+    def test_ionq_uses_given_configuration(self):
+        from azure.quantum.qiskit.backends import ionq
+
+        configuration = DummyProvider().get_backend("ionq.qpu").configuration()
+        with unittest.mock.patch.object(ionq, "_get_default_configuration") as build:
+            backend = ionq.IonQQPUBackend(
+                "ionq.qpu", None, configuration=configuration
+            )
+            qir_backend = ionq.IonQQPUQirBackend(
+                "ionq.qpu", None, configuration=configuration
+            )
+        build.assert_not_called()
+        self.assertIs(configuration, backend.configuration())
+        self.assertIs(configuration, qir_backend.configuration())
+        self.assertEqual("qis", backend.gateset())
+
+    @pytest.mark.ionq
+    def test_ionq_backends_log_initialization(self):
+        from azure.quantum.qiskit.backends import ionq
+
+        with self.assertLogs(ionq.logger, level="INFO") as logs:
+            ionq.IonQAriaBackend("ionq.qpu.aria-1", None)
+            ionq.IonQAriaQirBackend("ionq.qpu.aria-1", None)
+        self.assertEqual(
+            [
+                f"INFO:{ionq.__name__}:Initializing IonQAriaQPUBackend",
+                f"INFO:{ionq.__name__}:Initializing IonQAriaQirBackend",
+            ],
+            logs.output,
+        )
+
+    @pytest.mark.ionq
+    def test_ionq_default_options_are_not_shared(self):
+        from azure.quantum.qiskit.backends.ionq import IonQQirBackendBase
+
+        options = IonQQirBackendBase._default_options()
+        self.assertIsNot(options, IonQQirBackendBase._default_options())
+        self.assertEqual(500, options.shots)
+        self.assertEqual("BasicExecution", options.targetCapability)
+
+        backend = DummyProvider().get_backend("ionq.simulator")
+        backend.set_options(shots=100)
+        other = DummyProvider().get_backend("ionq.simulator")
+        self.assertEqual(100, backend.options.shots)
+        self.assertEqual(500, other.options.shots)
+
+    @pytest.mark.ionq
+    def test_ionq_reuses_circuit_translation(self):
+        from qiskit_ionq import helpers
+
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.simulator")
+        circuit = self._3_qubit_ghz()
+
+        with unittest.mock.patch.object(
+            helpers, "qiskit_circ_to_ionq_circ", wraps=helpers.qiskit_circ_to_ionq_circ
+        ) as translate:
+            metadata = backend._prepare_job_metadata(circuit)
+            # Mutating the returned map must not leak into later submissions.
+            metadata["meas_map"].append(3)
+            self.assertEqual([0, 1, 2], backend._prepare_job_metadata(circuit)["meas_map"])
+            payload = json.loads(backend._translate_input(circuit).decode("utf-8"))
+            self.assertEqual(1, translate.call_count)
+            # The translation is released once the payload has been built.
+            self.assertEqual({}, backend._translation_cache)
+
+            # Changing the circuit invalidates the previous translation.
+            backend._prepare_job_metadata(circuit)
+            circuit.x(3)
+            payload_after = json.loads(backend._translate_input(circuit).decode("utf-8"))
+            self.assertEqual(3, translate.call_count)
+
+        self.assertEqual(len(payload["circuit"]) + 1, len(payload_after["circuit"]))
+
+    @pytest.mark.ionq
+    def test_ionq_translation_cache_sees_same_length_edits(self):
+        from qiskit.circuit.library import XGate
+
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.simulator")
+        circuit = self._3_qubit_ghz()
+        circuit.rx(0.5, 3)
+
+        with unittest.mock.patch.object(provider, "get_workspace"):
+            backend.estimate_cost(circuit, shots=100)
+
+        # Replace a gate and swap two measurement clbits without changing the length.
+        circuit.data[0] = circuit.data[0].replace(operation=XGate())
+        measurements = [i for i, instr in enumerate(circuit.data) if instr.operation.name == "measure"]
+        first, last = measurements[0], measurements[-1]
+        circuit.data[first] = circuit.data[first].replace(clbits=(circuit.clbits[2],))
+        circuit.data[last] = circuit.data[last].replace(clbits=(circuit.clbits[0],))
+        # Update a parameter in place.
+        circuit.data[-1].operation.params[0] = 1.5
+
+        from qiskit_ionq.helpers import qiskit_circ_to_ionq_circ
+
+        expected_circ, _, expected_map = qiskit_circ_to_ionq_circ(circuit)
+        self.assertEqual("x", expected_circ[0]["gate"])
+        self.assertEqual([2, 1, 0], expected_map)
+
+        metadata = backend._prepare_job_metadata(circuit)
+        payload = json.loads(backend._translate_input(circuit).decode("utf-8"))
+        self.assertEqual(expected_map, metadata["meas_map"])
+        self.assertEqual(expected_circ, payload["circuit"])
+
+    @pytest.mark.ionq
+    def test_ionq_run_sees_edits_made_after_estimate_cost(self):
+        from qiskit.circuit.library import XGate
+        from qiskit_ionq import helpers
+
+        provider = DummyProvider()
+        backend = provider.get_backend("ionq.simulator")
+        circuit = self._3_qubit_ghz()
+
+        with unittest.mock.patch.object(provider, "get_workspace"):
+            backend.estimate_cost(circuit, shots=100)
+        circuit.data[0] = circuit.data[0].replace(operation=XGate())
+
+        with unittest.mock.patch.object(
+            helpers, "qiskit_circ_to_ionq_circ", wraps=helpers.qiskit_circ_to_ionq_circ
+        ) as translate, unittest.mock.patch.object(AzureBackendBase, "_run") as run:
+            backend.run(circuit)
+
+        # The edited circuit is translated once and shared by metadata and payload.
+        self.assertEqual(1, translate.call_count)
+        _, input_data, _, metadata = run.call_args.args
+        payload = json.loads(input_data.decode("utf-8"))
+        self.assertEqual("x", payload["circuit"][0]["gate"])
+        self.assertEqual([0, 1, 2], metadata["meas_map"])
+        # Nothing is kept once the job has been submitted.
+        self.assertEqual({}, backend._translation_cache)
+
+    @pytest.mark.ionq
+    def test_ionq_translate_input_miss_leaves_cache_untouched(self):
+        backend = DummyProvider().get_backend("ionq.simulator")
+        circuits = [self._3_qubit_ghz() for _ in range(16)]
+        for circuit in circuits:
+            backend._prepare_job_metadata(circuit)
+        cached_keys = list(backend._translation_cache)
+
+        circuit = self._3_qubit_ghz()
+        payload = json.loads(backend._translate_input(circuit).decode("utf-8"))
+
+        self.assertEqual(4, len(payload["circuit"]))
+        self.assertEqual(cached_keys, list(backend._translation_cache))
+
+    @pytest.mark.ionq
+    def test_ionq_translation_fingerprint_accepts_tuple_instructions(self):
+        from types import SimpleNamespace
+        from azure.quantum.qiskit.backends.ionq import _translation_fingerprint
+
+        circuit = self._3_qubit_ghz()
+        # qiskit-terra < 0.21 stores plain (operation, qargs, cargs) tuples.
+        legacy = SimpleNamespace(
+            qubits=circuit.qubits,
+            clbits=circuit.clbits,
+            data=[(op, list(qargs), list(cargs)) for op, qargs, cargs in circuit.data],
+        )
+        self.assertEqual(
+            _translation_fingerprint(circuit), _translation_fingerprint(legacy)
+        )
+
+    @pytest.mark.ionq
+    def test_ionq_translation_cache_does_not_keep_circuits_alive(self):
+        import gc
+        import weakref
+
+        backend = DummyProvider().get_backend("ionq.simulator")
+        circuit = self._3_qubit_ghz()
+        backend._prepare_job_metadata(circuit)
+        self.assertEqual(1, len(backend._translation_cache))
+
+        circuit_ref = weakref.ref(circuit)
+        del circuit
+        gc.collect()
+        self.assertIsNone(circuit_ref())
+        self.assertEqual({}, backend._translation_cache)
+
     @pytest.mark.ionq
     def test_translate_ionq_qir(self):
         circuit = self._3_qubit_ghz()